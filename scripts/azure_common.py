@@ -0,0 +1,202 @@
+"""
+Shared Azure Blob Storage helpers for the Vibe Data Platform scripts
+
+Imported by upload_to_azure.py and sync_azure.py (and file_md5 by ingest_files.py),
+which run as `python scripts/<name>.py` and so find this module beside them.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
+import shutil
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# The Azure SDK is slow to import, so it is loaded only once a client is needed
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import RequestsTransport
+    from azure.storage.blob import BlobServiceClient, ContainerClient
+
+# Messages go through a logger; the calling script's main() sends them to stdout
+log = logging.getLogger("azure_common")
+
+# Parallel range requests per blob, and the size above which uploads are chunked
+MAX_CONCURRENCY = min(16, (os.cpu_count() or 1) * 2)
+MAX_SINGLE_PUT_SIZE = 4 * 1024 * 1024
+
+# Files above this size are memory-mapped for upload rather than read through a file buffer
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# azcopy settings for the DuckDB transfer, used when azcopy is on PATH
+AZCOPY_BLOCK_SIZE_MB = 64
+AZCOPY_CONCURRENCY = 16
+
+# Pooled connections kept alive per host; sized for workers x per-blob concurrency
+CONNECTION_POOL_SIZE = 64
+
+# Raw data file types synced to the 'raw' container
+RAW_SUFFIXES = (".csv", ".parquet", ".json")
+
+
+def create_transport() -> RequestsTransport:
+    """Create an HTTP transport whose connection pool fits concurrent transfers.
+
+    The default pool keeps only 10 connections per host, so parallel transfers
+    beyond that would discard connections and repeat TCP/TLS handshakes. Passing
+    our own session skips azure-core's session setup, so its adapter (32 KiB
+    socket blocks) and retry settings (retries left to the SDK policy) are
+    mounted here with a larger pool.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from urllib3.util.retry import Retry
+
+    # The adapter lives in a private azure-core module; fall back to the plain one if it moves
+    try:
+        from azure.core.pipeline.transport._requests_basic import BiggerBlockSizeHTTPAdapter as Adapter
+    except ImportError:
+        from requests.adapters import HTTPAdapter as Adapter
+
+    session = requests.Session()
+    adapter = Adapter(
+        pool_connections=CONNECTION_POOL_SIZE,
+        pool_maxsize=CONNECTION_POOL_SIZE,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, connection_timeout=10, read_timeout=300)
+
+
+@functools.lru_cache(maxsize=1)
+def get_blob_service_client() -> BlobServiceClient:
+    """Create Azure Blob Service client from environment variables.
+
+    The client is created once per process and shared, so every container and
+    blob client derived from it reuses one connection pool. Don't close it mid-run.
+    """
+    try:
+        from azure.storage.blob import BlobServiceClient
+    except ImportError:
+        print("Error: azure-storage-blob not installed.")
+        print("Install with: pip install azure-storage-blob")
+        sys.exit(1)
+
+    connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+
+    if connection_string:
+        return BlobServiceClient.from_connection_string(
+            connection_string,
+            max_single_put_size=MAX_SINGLE_PUT_SIZE,
+            transport=create_transport(),
+        )
+
+    account_name = os.environ.get("AZURE_STORAGE_ACCOUNT")
+    account_key = os.environ.get("AZURE_STORAGE_KEY")
+
+    if not account_name or not account_key:
+        print("Error: Azure credentials not configured.")
+        print("Set AZURE_STORAGE_CONNECTION_STRING or both AZURE_STORAGE_ACCOUNT and AZURE_STORAGE_KEY")
+        sys.exit(1)
+
+    account_url = f"https://{account_name}.blob.core.windows.net"
+    return BlobServiceClient(
+        account_url=account_url,
+        credential=account_key,
+        max_single_put_size=MAX_SINGLE_PUT_SIZE,
+        transport=create_transport(),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_container_client(blob_service: BlobServiceClient, container: str) -> ContainerClient:
+    """Return a container client derived from the shared service client, created once per name."""
+    return blob_service.get_container_client(container)
+
+
+def humansize(n: int) -> str:
+    """Format a byte count with a binary unit."""
+    if n < 1024:
+        return f"{n:,} B"
+    if n < 1024 ** 2:
+        return f"{n / 1024:.1f} KiB"
+    if n < 1024 ** 3:
+        return f"{n / 1024 ** 2:.1f} MiB"
+    return f"{n / 1024 ** 3:.1f} GiB"
+
+
+def azcopy_available() -> bool:
+    """Check whether the azcopy CLI is installed."""
+    return shutil.which("azcopy") is not None
+
+
+def blob_sas_url(blob_client, **permissions) -> str:
+    """Build a short-lived SAS URL for a blob, or None if the client has no account key."""
+    from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
+    account_key = getattr(blob_client.credential, "account_key", None)
+    if not account_key:
+        return None
+
+    sas = generate_blob_sas(
+        blob_client.account_name,
+        blob_client.container_name,
+        blob_client.blob_name,
+        account_key=account_key,
+        permission=BlobSasPermissions(**permissions),
+        expiry=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    return f"{blob_client.url}?{sas}"
+
+
+def run_azcopy(source: str, destination: str, *flags: str) -> bool:
+    """Run azcopy copy and report whether the job completed.
+
+    azcopy prints one JSON message per line with --output-type=json; the final
+    EndOfJob message carries the job status.
+    """
+    result = subprocess.run(
+        ["azcopy", "copy", source, destination, "--output-type=json",
+         f"--block-size-mb={AZCOPY_BLOCK_SIZE_MB}", *flags],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "AZCOPY_CONCURRENCY_VALUE": str(AZCOPY_CONCURRENCY)},
+    )
+
+    status = None
+    for line in result.stdout.splitlines():
+        try:
+            message = json.loads(line)
+            if message.get("MessageType") == "EndOfJob":
+                status = json.loads(message["MessageContent"]).get("JobStatus")
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            continue
+
+    if result.returncode != 0 or status not in (None, "Completed"):
+        log.warning("  azcopy failed (exit %d, status %s), falling back to the SDK", result.returncode, status)
+        return False
+    return True
+
+
+def file_md5(file_path: Path) -> bytes:
+    """Compute the MD5 digest of a file by hashing a read-only memory map of it."""
+    with open(file_path, "rb") as f:
+        # mmap cannot map empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.md5().digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.md5(mm).digest()
+
+
+def list_raw_files(raw_path: Path) -> list:
+    """List raw data files in a single directory pass."""
+    with os.scandir(raw_path) as it:
+        return [Path(e.path) for e in it if e.name.endswith(RAW_SUFFIXES) and e.is_file()]
@@ -12,15 +12,60 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import json
+import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional streaming JSON parser for large array responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+# Optional Rust-backed JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Parquet output for tabular responses
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Maximum number of endpoints extracted concurrently per API
+MAX_WORKERS = 8
+
+# Per-endpoint progress goes through a logger rather than print; main() sends it to stdout
+log = logging.getLogger("extract_api")
 
 
 def load_config() -> dict:
@@ -30,8 +75,17 @@ def load_config() -> dict:
         print(f"Error: Config file not found: {config_path}")
         sys.exit(1)
 
+    return parse_config(config_path, config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def parse_config(config_path: Path, mtime_ns: int) -> dict:
+    """Parse a YAML config file, cached until its modification time changes.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def get_auth_header(api_config: dict) -> dict:
@@ -60,19 +114,126 @@ def get_auth_header(api_config: dict) -> dict:
     return {}
 
 
-def extract_endpoint(api_name: str, api_config: dict, endpoint: dict) -> bool:
-    """Extract data from a single API endpoint."""
+def create_session(api_config: dict) -> requests.Session:
+    """Create a session that reuses connections and retries transient failures."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+
+    session = requests.Session()
+    session.mount(api_config["base_url"], adapter)
+    return session
+
+
+class RateLimiter:
+    """Space out request starts to honour an API's requests_per_minute limit."""
+
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next request slot is available."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(slot - now)
+
+
+def encode_json(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which the stdlib encoder handles
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def open_body(response: requests.Response) -> io.BufferedReader:
+    """Wrap a streamed response body so its first bytes can be peeked at."""
+    response.raw.decode_content = True
+    # Otherwise urllib3 reports the body closed once drained, before the buffer is read
+    response.raw.auto_close = False
+    return io.BufferedReader(response.raw)
+
+
+def body_is_array(body: io.BufferedReader) -> bool:
+    """Check whether a buffered JSON body is a top-level array, without consuming it."""
+    return body.peek(64).lstrip().startswith(b"[")
+
+
+def write_streamed(body: io.BufferedReader, metadata: dict, output_file: Path) -> int:
+    """Stream a top-level JSON array body to disk one record at a time.
+
+    The body is parsed incrementally, so memory use stays flat regardless of
+    response size. record_count is written after the data array because it is
+    only known once the stream has been consumed. Records go to a temporary
+    file that replaces output_file only once the whole body has been written,
+    so a failed transfer leaves the previous extract in place.
+    """
+    record_count = 0
+    tmp_file = output_file.with_name(f".{output_file.name}.part")
+
+    try:
+        with open(tmp_file, "wb") as f:
+            # Open the envelope object, leaving it unterminated for the data array
+            f.write(encode_json(metadata)[:-1] + b', "data": [')
+            for item in ijson.items(body, "item", use_float=True):
+                if record_count:
+                    f.write(b",")
+                f.write(b"\n  " + encode_json(item))
+                record_count += 1
+            f.write(f'\n], "record_count": {record_count}}}\n'.encode())
+
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    return record_count
+
+
+def is_tabular(data: Any) -> bool:
+    """Check whether a response is a non-empty list of records."""
+    return isinstance(data, list) and bool(data) and all(isinstance(item, dict) for item in data)
+
+
+def write_parquet(data: list, metadata: dict, output_file: Path, schema: "pa.Schema" = None) -> None:
+    """Write a list of records as a Parquet table, keeping metadata in the file footer.
+
+    The schema is inferred across all records, so keys missing from the first
+    record still become columns. Values that can't share a column type raise
+    pa.ArrowException, and integers beyond int64 raise OverflowError. An empty
+    list is written as an empty table with schema.
+    """
+    table = pa.Table.from_struct_array(pa.array(data)) if data else schema.empty_table()
+    table = table.replace_schema_metadata({key: str(value) for key, value in metadata.items()})
+    pq.write_table(table, output_file, compression="zstd")
+
+
+def extract_endpoint(api_name: str, api_config: dict, endpoint: dict,
+                     session: requests.Session = None,
+                     rate_limiter: RateLimiter = None) -> bool:
+    """Extract data from a single API endpoint.
+
+    Endpoints run concurrently, so every message is a single line naming the endpoint.
+    """
+    name = endpoint["name"]
     base_url = api_config["base_url"]
     url = f"{base_url}{endpoint['path']}"
     method = endpoint.get("method", "GET")
     output_file = Path(__file__).parent.parent / endpoint["output_file"]
+    http = session or requests
 
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    print(f"  Extracting: {endpoint['name']}")
-    print(f"    URL: {url}")
-
     try:
         headers = get_auth_header(api_config)
         headers["Accept"] = "application/json"
@@ -80,40 +241,101 @@ def extract_endpoint(api_name: str, api_config: dict, endpoint: dict) -> bool:
         # Get query parameters from endpoint config
         params = endpoint.get("params", {})
 
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, params=params, timeout=30)
-        else:
-            print(f"    Error: Unsupported method {method}")
+        # Parquet output needs the full record list to infer a schema, so only
+        # JSON output of top-level arrays can be streamed straight to disk
+        as_parquet = output_file.suffix.lower() == ".parquet"
+        stream = endpoint.get("stream", False) and IJSON_AVAILABLE and not as_parquet
+
+        if method not in ("GET", "POST"):
+            log.error("  %s: Error: Unsupported method %s", name, method)
             return False
 
-        response.raise_for_status()
-        data = response.json()
+        def send(stream: bool) -> requests.Response:
+            if rate_limiter:
+                rate_limiter.wait()
+            request = http.get if method == "GET" else http.post
+            response = request(url, headers=headers, params=params, timeout=30, stream=stream)
+            response.raise_for_status()
+            return response
 
         # Add metadata
-        result = {
+        metadata = {
             "extracted_at": datetime.utcnow().isoformat() + "Z",
             "source": api_name,
             "endpoint": endpoint["name"],
             "url": url,
-            "record_count": len(data) if isinstance(data, list) else 1,
-            "data": data
         }
 
-        # Write to file
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
-
-        record_count = len(data) if isinstance(data, list) else 1
-        print(f"    Success: {record_count} records -> {output_file}")
+        # Closing the response hands a streamed connection back to the session pool
+        with send(stream) as response:
+            body = open_body(response) if stream else None
+            if body is not None and not body_is_array(body):
+                # Only arrays can be streamed item by item; parse anything else whole
+                log.warning("  %s: Warning: response is not a JSON array, parsing it in full", name)
+                stream = False
+
+            if stream:
+                try:
+                    record_count = write_streamed(body, metadata, output_file)
+                except ijson.JSONError as e:
+                    # The C parser rejects integers beyond 64 bits; the full-body parser doesn't
+                    if "integer overflow" not in str(e):
+                        raise
+                    log.warning("  %s: Warning: integer too large to stream, fetching in full", name)
+                    stream = False
+                    body = None
+                    response = send(False)
+
+            if not stream:
+                data = json.loads(body.read()) if body is not None else response.json()
+                record_count = len(data) if isinstance(data, list) else 1
+                result = {**metadata, "record_count": record_count, "data": data}
+
+                # An empty response keeps the columns of the previous extract, if there is one
+                keep_schema = as_parquet and PYARROW_AVAILABLE and data == [] and output_file.exists()
+
+                if as_parquet and not PYARROW_AVAILABLE:
+                    log.warning("  %s: Warning: pyarrow not installed, writing JSON instead", name)
+                elif as_parquet and not is_tabular(data) and not keep_schema:
+                    log.warning("  %s: Warning: response is not a list of records, writing JSON instead", name)
+
+                written = False
+                if as_parquet and PYARROW_AVAILABLE and (is_tabular(data) or keep_schema):
+                    try:
+                        schema = pq.read_schema(output_file) if keep_schema else None
+                        write_parquet(data, {**metadata, "record_count": record_count}, output_file, schema)
+                        written = True
+                    except (pa.ArrowException, OverflowError) as e:
+                        # OverflowError: integers beyond int64, which JSON output keeps intact
+                        log.warning("  %s: Warning: records don't fit a Parquet schema (%s), writing JSON instead",
+                                    name, e)
+
+                if not written:
+                    output_file = output_file.with_suffix(".json")
+
+                    # Write to file
+                    output_file.write_bytes(encode_json(result, indent=True))
+
+                # Ingestion names tables by file stem, so a sibling left by an earlier run
+                # would be loaded into the same table and overwrite this one
+                if as_parquet:
+                    stale = output_file.with_suffix(".json" if written else ".parquet")
+                    if stale.exists():
+                        log.info("  %s: Removing stale %s", name, stale.name)
+                        stale.unlink()
+
+        log.info("  %s: %s records from %s -> %s", name, record_count, url, output_file)
         return True
 
     except requests.exceptions.RequestException as e:
-        print(f"    Error: {e}")
+        log.error("  %s: Error: %s", name, e)
+        return False
+    except Urllib3Error as e:
+        # Streamed bodies are read straight from urllib3, whose errors requests doesn't wrap
+        log.error("  %s: Error: %s", name, e)
         return False
-    except json.JSONDecodeError as e:
-        print(f"    Error: Invalid JSON response - {e}")
+    except JSON_ERRORS as e:
+        log.error("  %s: Error: Invalid JSON response from %s - %s", name, url, e)
         return False
 
 
@@ -124,14 +346,29 @@ def extract_api(api_name: str, api_config: dict, endpoint_filter: str = None) ->
 
     results = {"success": 0, "failed": 0}
 
-    for endpoint in api_config.get("endpoints", []):
-        if endpoint_filter and endpoint["name"] != endpoint_filter:
-            continue
-
-        if extract_endpoint(api_name, api_config, endpoint):
-            results["success"] += 1
-        else:
-            results["failed"] += 1
+    endpoints = [
+        endpoint for endpoint in api_config.get("endpoints", [])
+        if not endpoint_filter or endpoint["name"] == endpoint_filter
+    ]
+    if not endpoints:
+        return results
+
+    requests_per_minute = api_config.get("rate_limit", {}).get("requests_per_minute")
+    rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+
+    # Endpoints are IO-bound, so extract them concurrently over the shared session
+    with create_session(api_config) as session, \
+            ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(endpoints))) as executor:
+        futures = [
+            executor.submit(extract_endpoint, api_name, api_config, endpoint, session, rate_limiter)
+            for endpoint in endpoints
+        ]
+
+        for future in as_completed(futures):
+            if future.result():
+                results["success"] += 1
+            else:
+                results["failed"] += 1
 
     return results
 
@@ -161,6 +398,8 @@ def main():
     parser.add_argument("--all", action="store_true", help="Extract from all enabled APIs")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     config = load_config()
 
     if args.list:
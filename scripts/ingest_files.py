@@ -14,21 +14,41 @@ Usage:
 """
 
 import argparse
+import functools
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 import duckdb
 import yaml
 
+from azure_common import file_md5
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Optional Azure support
 try:
-    from azure.storage.blob import BlobServiceClient
+    from azure.core.exceptions import ResourceNotFoundError
+    from azure.storage.blob import BlobServiceClient, ContentSettings
     AZURE_AVAILABLE = True
 except ImportError:
     AZURE_AVAILABLE = False
 
+# Files uploaded in parallel, and block uploads in flight per file
+AZURE_UPLOAD_WORKERS = 8
+AZURE_MAX_CONCURRENCY = 4
+
+# Read buffer for upload file handles (default is 8 KB)
+UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
 
 def load_config() -> dict:
     """Load source configuration from config/sources.yml."""
@@ -37,15 +57,55 @@ def load_config() -> dict:
         print(f"Error: Config file not found: {config_path}")
         sys.exit(1)
 
+    return parse_config(config_path, config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def parse_config(config_path: Path, mtime_ns: int) -> dict:
+    """Parse a YAML config file, cached until its modification time changes.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
+@functools.lru_cache(maxsize=1)
 def get_db_path() -> Path:
     """Get the DuckDB database path."""
     return Path(__file__).parent.parent / "data" / "processed" / "vibe.duckdb"
 
 
+@functools.lru_cache(maxsize=1)
+def get_memory_connection() -> duckdb.DuckDBPyConnection:
+    """Get a shared in-memory DuckDB connection for inspecting files.
+
+    The connection lives for the rest of the process and must not be closed.
+    """
+    return duckdb.connect(":memory:")
+
+
+def get_read_function(suffix: str, combine: bool = False) -> str:
+    """Build the DuckDB table function that reads a file or glob pattern.
+
+    The path is left as a ? placeholder to be bound as a query parameter.
+    With combine=True, files are unioned by column name and each row records
+    the file it came from in a filename column.
+    """
+    readers = {
+        ".csv": "read_csv_auto",
+        ".parquet": "read_parquet",
+        ".json": "read_json_auto",
+    }
+    reader = readers.get(suffix.lower())
+    if reader is None:
+        return None
+
+    if combine:
+        return f"{reader}(?, filename=true, union_by_name=true)"
+    return f"{reader}(?)"
+
+
 def list_files(config: dict) -> None:
     """List all available data files."""
     base_path = Path(__file__).parent.parent
@@ -74,54 +134,99 @@ def list_files(config: dict) -> None:
             print(f"  (no {file_type} files found)")
 
 
+def get_schema_cache_path(file_path: Path) -> Path:
+    """Get the cache file holding the last computed schema of a data file."""
+    return Path(__file__).parent.parent / ".cache" / "schema" / f"{file_path.name}.json"
+
+
+def read_schema(con: duckdb.DuckDBPyConnection, file_path: Path) -> dict:
+    """Read column names, types and row count of a data file."""
+    read_func = get_read_function(file_path.suffix)
+
+    # DESCRIBE only sniffs the file, it does not scan it
+    columns = con.execute(f"DESCRIBE SELECT * FROM {read_func}", [str(file_path)]).fetchall()
+
+    if file_path.suffix.lower() == ".parquet":
+        # Row count is stored in the Parquet footer, so no scan is needed
+        count_query = "SELECT SUM(num_rows) FROM parquet_file_metadata(?)"
+    else:
+        count_query = f"SELECT COUNT(*) FROM {read_func}"
+    row_count = con.execute(count_query, [str(file_path)]).fetchone()[0]
+
+    return {"columns": [[row[0], row[1]] for row in columns], "row_count": row_count}
+
+
 def show_schema(file_path: Path) -> None:
     """Show the schema of a data file."""
     if not file_path.exists():
         print(f"Error: File not found: {file_path}")
         return
 
+    if get_read_function(file_path.suffix) is None:
+        print(f"Error: Unsupported file type: {file_path.suffix}")
+        return
+
     print(f"\nSchema for: {file_path.name}")
     print("-" * 50)
 
-    con = duckdb.connect(":memory:")
-
-    try:
-        if file_path.suffix.lower() == ".csv":
-            query = f"DESCRIBE SELECT * FROM read_csv_auto('{file_path}')"
-        elif file_path.suffix.lower() == ".parquet":
-            query = f"DESCRIBE SELECT * FROM read_parquet('{file_path}')"
-        elif file_path.suffix.lower() == ".json":
-            query = f"DESCRIBE SELECT * FROM read_json_auto('{file_path}')"
-        else:
-            print(f"Error: Unsupported file type: {file_path.suffix}")
+    # Reuse the cached schema while the file is unchanged
+    cache_path = get_schema_cache_path(file_path)
+    cache_key = {"path": str(file_path.resolve()), "mtime_ns": file_path.stat().st_mtime_ns}
+    schema = None
+
+    if cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            cached = {}  # An unreadable cache entry is treated as a miss
+        if cached.get("key") == cache_key:
+            schema = cached["schema"]
+
+    if schema is None:
+        try:
+            schema = read_schema(get_memory_connection(), file_path)
+        except Exception as e:
+            print(f"Error reading file: {e}")
             return
 
-        result = con.execute(query).fetchall()
+        # Write then rename, so an interrupted run never leaves a truncated cache entry
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        tmp_path.write_text(json.dumps({"key": cache_key, "schema": schema}))
+        os.replace(tmp_path, cache_path)
 
-        print(f"{'Column':<30} {'Type':<20}")
-        print("-" * 50)
-        for row in result:
-            print(f"{row[0]:<30} {row[1]:<20}")
+    print(f"{'Column':<30} {'Type':<20}")
+    print("-" * 50)
+    for name, column_type in schema["columns"]:
+        print(f"{name:<30} {column_type:<20}")
 
-        # Show row count
-        if file_path.suffix.lower() == ".csv":
-            count_query = f"SELECT COUNT(*) FROM read_csv_auto('{file_path}')"
-        elif file_path.suffix.lower() == ".parquet":
-            count_query = f"SELECT COUNT(*) FROM read_parquet('{file_path}')"
-        elif file_path.suffix.lower() == ".json":
-            count_query = f"SELECT COUNT(*) FROM read_json_auto('{file_path}')"
+    print(f"\nTotal rows: {schema['row_count']:,}")
 
-        row_count = con.execute(count_query).fetchone()[0]
-        print(f"\nTotal rows: {row_count:,}")
 
-    except Exception as e:
-        print(f"Error reading file: {e}")
-    finally:
-        con.close()
+def open_log() -> TextIO:
+    """Open the pipeline run log for appending, line-buffered so it stays tail-friendly."""
+    log_path = Path(__file__).parent.parent / "logs" / "pipeline_runs.log"
+    return open(log_path, "a", buffering=1)
+
+
+def log_ingestion(entry: str, log_file: TextIO = None) -> None:
+    """Append a timestamped entry to the pipeline run log."""
+    line = f"[{datetime.now().isoformat()}] {entry}\n"
+    if log_file is not None:
+        log_file.write(line)
+        return
 
+    with open_log() as f:
+        f.write(line)
 
-def ingest_file(file_path: Path, table_name: str = None) -> bool:
-    """Ingest a single file into DuckDB."""
+
+def ingest_file(file_path: Path, table_name: str = None,
+                con: duckdb.DuckDBPyConnection = None, log_file: TextIO = None) -> bool:
+    """Ingest a single file into DuckDB.
+
+    Pass an open connection and log file to reuse them across files; otherwise
+    they are opened and closed for this file.
+    """
     if not file_path.exists():
         print(f"Error: File not found: {file_path}")
         return False
@@ -137,23 +242,20 @@ def ingest_file(file_path: Path, table_name: str = None) -> bool:
     print(f"  Table: {table_name}")
     print(f"  Database: {db_path}")
 
-    con = duckdb.connect(str(db_path))
+    owns_connection = con is None
+    if owns_connection:
+        con = duckdb.connect(str(db_path))
 
     try:
         # Read file based on extension
-        if file_path.suffix.lower() == ".csv":
-            read_func = f"read_csv_auto('{file_path}')"
-        elif file_path.suffix.lower() == ".parquet":
-            read_func = f"read_parquet('{file_path}')"
-        elif file_path.suffix.lower() == ".json":
-            read_func = f"read_json_auto('{file_path}')"
-        else:
+        read_func = get_read_function(file_path.suffix)
+        if read_func is None:
             print(f"  Error: Unsupported file type: {file_path.suffix}")
             return False
 
         # Create or replace table
         query = f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {read_func}"
-        con.execute(query)
+        con.execute(query, [str(file_path)])
 
         # Get row count
         row_count = con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
@@ -161,10 +263,7 @@ def ingest_file(file_path: Path, table_name: str = None) -> bool:
         print(f"  Success: {row_count:,} rows loaded")
 
         # Log ingestion
-        log_path = Path(__file__).parent.parent / "logs" / "pipeline_runs.log"
-        with open(log_path, "a") as f:
-            timestamp = datetime.now().isoformat()
-            f.write(f"[{timestamp}] INGESTED file={file_path.name} table={table_name} rows={row_count}\n")
+        log_ingestion(f"INGESTED file={file_path.name} table={table_name} rows={row_count}", log_file)
 
         return True
 
@@ -172,7 +271,45 @@ def ingest_file(file_path: Path, table_name: str = None) -> bool:
         print(f"  Error: {e}")
         return False
     finally:
-        con.close()
+        if owns_connection:
+            con.close()
+
+
+def ingest_glob(search_path: Path, pattern: str, file_type: str, table_name: str,
+                con: duckdb.DuckDBPyConnection, log_file: TextIO = None) -> bool:
+    """Ingest every file matching a pattern into a single table in one statement."""
+    source = search_path / pattern
+
+    print(f"\nIngesting: {source}")
+    print(f"  Table: {table_name}")
+
+    try:
+        read_func = get_read_function(f".{file_type}", combine=True)
+        if read_func is None:
+            print(f"  Error: Unsupported file type: {file_type}")
+            return False
+
+        # Naming the column in the filename option needs DuckDB 1.1, so rename it here
+        con.execute(
+            f"CREATE OR REPLACE TABLE {table_name} AS "
+            f"SELECT * EXCLUDE (filename), filename AS _source_file FROM {read_func}",
+            [str(source)],
+        )
+
+        row_count, file_count = con.execute(
+            f"SELECT COUNT(*), COUNT(DISTINCT _source_file) FROM {table_name}"
+        ).fetchone()
+
+        print(f"  Success: {row_count:,} rows loaded from {file_count} files")
+
+        # Log ingestion
+        log_ingestion(f"INGESTED files={pattern} table={table_name} rows={row_count}", log_file)
+
+        return True
+
+    except Exception as e:
+        print(f"  Error: {e}")
+        return False
 
 
 def ingest_all(config: dict) -> dict:
@@ -182,26 +319,68 @@ def ingest_all(config: dict) -> dict:
 
     file_configs = config.get("sources", {}).get("files", {})
 
-    for file_type, type_config in file_configs.items():
-        if not type_config.get("enabled", False):
-            continue
-
-        pattern = type_config.get("pattern", f"*.{file_type}")
-        search_path = base_path / type_config.get("path", "data/raw/")
-
-        files = list(search_path.glob(pattern))
-
-        for file_path in files:
-            if ingest_file(file_path):
-                results["success"] += 1
-            else:
-                results["failed"] += 1
+    # Share one connection so the database is opened and its catalog loaded once,
+    # and one log handle so entries are not each an open/append/close
+    db_path = get_db_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with duckdb.connect(str(db_path)) as con, open_log() as log_file:
+        for file_type, type_config in file_configs.items():
+            if not type_config.get("enabled", False):
+                continue
+
+            pattern = type_config.get("pattern", f"*.{file_type}")
+            search_path = base_path / type_config.get("path", "data/raw/")
+
+            files = list(search_path.glob(pattern))
+
+            # A configured table loads all matching files together via a DuckDB glob
+            if type_config.get("table"):
+                if not files:
+                    continue
+                if ingest_glob(search_path, pattern, file_type, type_config["table"], con, log_file):
+                    results["success"] += 1
+                else:
+                    results["failed"] += 1
+                continue
+
+            for file_path in files:
+                if ingest_file(file_path, con=con, log_file=log_file):
+                    results["success"] += 1
+                else:
+                    results["failed"] += 1
 
     return results
 
 
-def upload_to_azure(file_path: Path, config: dict) -> bool:
-    """Upload a file to Azure Blob Storage after ingestion."""
+def get_blob_service(config: dict) -> "BlobServiceClient":
+    """Create an Azure Blob Service client from the configured credentials."""
+    azure_config = config.get("azure", {})
+
+    # Get credentials from environment
+    connection_string = os.environ.get(
+        azure_config.get("connection_string_env", "AZURE_STORAGE_CONNECTION_STRING")
+    )
+    account_name = os.environ.get(
+        azure_config.get("storage_account_env", "AZURE_STORAGE_ACCOUNT")
+    )
+    account_key = os.environ.get(
+        azure_config.get("storage_key_env", "AZURE_STORAGE_KEY")
+    )
+
+    if connection_string:
+        return BlobServiceClient.from_connection_string(connection_string)
+    if account_name and account_key:
+        account_url = f"https://{account_name}.blob.core.windows.net"
+        return BlobServiceClient(account_url=account_url, credential=account_key)
+    return None
+
+
+def upload_to_azure(file_path: Path, config: dict,
+                    blob_service: "BlobServiceClient" = None) -> bool:
+    """Upload a file to Azure Blob Storage after ingestion.
+
+    Pass a shared blob_service to reuse its connection pool across uploads.
+    """
     if not AZURE_AVAILABLE:
         print("  Warning: azure-storage-blob not installed, skipping Azure upload")
         return False
@@ -211,23 +390,9 @@ def upload_to_azure(file_path: Path, config: dict) -> bool:
         return False
 
     try:
-        # Get credentials from environment
-        connection_string = os.environ.get(
-            azure_config.get("connection_string_env", "AZURE_STORAGE_CONNECTION_STRING")
-        )
-        account_name = os.environ.get(
-            azure_config.get("storage_account_env", "AZURE_STORAGE_ACCOUNT")
-        )
-        account_key = os.environ.get(
-            azure_config.get("storage_key_env", "AZURE_STORAGE_KEY")
-        )
-
-        if connection_string:
-            blob_service = BlobServiceClient.from_connection_string(connection_string)
-        elif account_name and account_key:
-            account_url = f"https://{account_name}.blob.core.windows.net"
-            blob_service = BlobServiceClient(account_url=account_url, credential=account_key)
-        else:
+        if blob_service is None:
+            blob_service = get_blob_service(config)
+        if blob_service is None:
             print("  Warning: Azure credentials not configured")
             return False
 
@@ -236,14 +401,31 @@ def upload_to_azure(file_path: Path, config: dict) -> bool:
         container_client = blob_service.get_container_client(container_name)
         blob_client = container_client.get_blob_client(file_path.name)
 
+        # Skip the upload when the blob already holds identical content
+        local_md5 = file_md5(file_path)
+        try:
+            remote_md5 = blob_client.get_blob_properties().content_settings.content_md5
+        except ResourceNotFoundError:
+            remote_md5 = None
+
+        if remote_md5 and bytes(remote_md5) == local_md5:
+            print(f"  Azure blob unchanged: {container_name}/{file_path.name}")
+            return True
+
         print(f"  Uploading to Azure: {container_name}/{file_path.name}")
-        with open(file_path, "rb") as data:
-            blob_client.upload_blob(data, overwrite=True)
-        print(f"  Azure upload successful")
+        with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as data:
+            blob_client.upload_blob(
+                data,
+                overwrite=True,
+                length=file_path.stat().st_size,
+                max_concurrency=AZURE_MAX_CONCURRENCY,
+                content_settings=ContentSettings(content_md5=local_md5),
+            )
+        print(f"  Azure upload successful: {file_path.name}")
         return True
 
     except Exception as e:
-        print(f"  Warning: Azure upload failed: {e}")
+        print(f"  Warning: Azure upload failed for {file_path.name}: {e}")
         return False
 
 
@@ -291,11 +473,18 @@ def main():
         print("\nUploading to Azure Blob Storage...")
         base_path = Path(__file__).parent.parent
         raw_path = base_path / "data" / "raw"
-        azure_success = 0
-        for pattern in ["*.csv", "*.parquet", "*.json"]:
-            for f in raw_path.glob(pattern):
-                if upload_to_azure(f, config):
-                    azure_success += 1
+        files = [f for pattern in ["*.csv", "*.parquet", "*.json"] for f in raw_path.glob(pattern)]
+
+        # Share one client across concurrent uploads so connections are pooled
+        try:
+            blob_service = get_blob_service(config) if AZURE_AVAILABLE else None
+        except Exception as e:
+            print(f"  Warning: Azure client setup failed: {e}")
+            blob_service = None
+
+        with ThreadPoolExecutor(max_workers=AZURE_UPLOAD_WORKERS) as executor:
+            uploaded = executor.map(lambda f: upload_to_azure(f, config, blob_service), files)
+            azure_success = sum(uploaded)
         print(f"Azure upload: {azure_success} files uploaded")
 
 
@@ -15,127 +15,326 @@ Usage:
 Environment Variables (or use .env file):
     AZURE_STORAGE_ACCOUNT       - Storage account name
     AZURE_STORAGE_KEY           - Storage account access key
+
+Blobs are listed flat (no directory walk), so keep raw blob names as flat keys
+with a shared leading prefix rather than nested folders; this keeps --prefix
+listings to a tight server-side range.
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
+import json
+import logging
+import mmap
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from azure_common import (
+    MAX_CONCURRENCY,
+    MMAP_THRESHOLD,
+    RAW_SUFFIXES,
+    azcopy_available,
+    blob_sas_url,
+    file_md5,
+    get_blob_service_client,
+    get_container_client,
+    humansize,
+    list_raw_files,
+    run_azcopy,
+)
+
+# The Azure SDK is slow to import, so it is loaded only once a client is needed
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobProperties, BlobServiceClient, ContainerClient
+
+# Only pay for python-dotenv when there is a .env file to load
+ENV_FILE = Path(__file__).parent.parent / ".env"
+if ENV_FILE.exists():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+    except ImportError:
+        pass
 
-try:
-    from azure.storage.blob import BlobServiceClient
-except ImportError:
-    print("Error: azure-storage-blob not installed.")
-    print("Install with: pip install azure-storage-blob")
-    sys.exit(1)
+# Per-blob progress goes through a logger rather than print; main() sends it to stdout
+log = logging.getLogger("sync_azure")
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# Default number of blobs transferred in parallel
+DEFAULT_WORKERS = 16
 
+# Blobs returned per listing request (service maximum)
+LIST_PAGE_SIZE = 5000
 
-def get_blob_service_client() -> BlobServiceClient:
-    """Create Azure Blob Service client from environment variables."""
-    connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+# Blob batch requests carry at most 256 sub-requests each
+BATCH_SIZE = 256
 
-    if connection_string:
-        return BlobServiceClient.from_connection_string(connection_string)
+# Blobs above this size are downloaded as concurrent range requests of RANGE_SIZE each
+RANGED_DOWNLOAD_THRESHOLD = 256 * 1024 * 1024
+RANGE_SIZE = 64 * 1024 * 1024
 
-    account_name = os.environ.get("AZURE_STORAGE_ACCOUNT")
-    account_key = os.environ.get("AZURE_STORAGE_KEY")
+# Per-blob sync state (etag, MD5, local size and mtime) used to skip unchanged transfers
+STATE_DIR = Path(__file__).parent.parent / ".cache" / "sync_azure"
+
+
+def warn_if_hns(blob_service: BlobServiceClient) -> None:
+    """Warn when the account has a hierarchical namespace, which slows large listings."""
+    try:
+        info = blob_service.get_account_information()
+    except Exception:
+        return  # Credentials scoped below account level can't read this; not worth failing over
+
+    if info.get("is_hns_enabled"):
+        print("Warning: hierarchical namespace is enabled on this account; "
+              "listing large containers may be slow")
+
+
+class HumanSize:
+    """Byte count that is only formatted if a log record using it is emitted."""
+
+    __slots__ = ("n",)
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def __str__(self) -> str:
+        return humansize(self.n)
+
+
+def drop_page_cache(path: Path) -> None:
+    """Ask the kernel to evict a file from the page cache, where supported.
+
+    DuckDB reads through its own buffer pool, so cached pages of a freshly
+    transferred database only take memory away from queries.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)  # Dirty pages are not dropped until written back
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def load_state(container_name: str, blob_name: str, local_path: Path) -> dict:
+    """Load the recorded sync state of a blob, if the local file is unchanged since."""
+    state_path = STATE_DIR / container_name / f"{blob_name}.json"
+    if not state_path.exists() or not local_path.exists():
+        return {}
+
+    try:
+        state = json.loads(state_path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return {}  # An unreadable state file just means the blob gets checked again
+
+    stat = local_path.stat()
+    if (state.get("path") != str(local_path.resolve())
+            or state.get("size") != stat.st_size
+            or state.get("mtime_ns") != stat.st_mtime_ns):
+        return {}
+    return state
+
+
+def save_state(container_name: str, blob_name: str, local_path: Path,
+               etag: str, md5: bytes = None) -> None:
+    """Record that a local file and blob are in sync."""
+    state_path = STATE_DIR / container_name / f"{blob_name}.json"
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+
+    stat = local_path.stat()
+
+    # Write then rename, so an interrupted run never leaves a truncated state file
+    tmp_path = state_path.with_name(f"{state_path.name}.tmp")
+    tmp_path.write_text(json.dumps({
+        "path": str(local_path.resolve()),
+        "etag": etag,
+        "md5": md5.hex() if md5 else None,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }))
+    os.replace(tmp_path, state_path)
+
+
+def list_remote(container_client: ContainerClient, prefix: str = None) -> dict:
+    """Map blob names to their listed properties, or an empty map if listing fails."""
+    try:
+        blobs = container_client.list_blobs(name_starts_with=prefix, results_per_page=LIST_PAGE_SIZE)
+        return {blob.name: blob for blob in blobs}
+    except Exception:
+        return {}
 
-    if not account_name or not account_key:
-        print("Error: Azure credentials not configured.")
-        sys.exit(1)
 
-    account_url = f"https://{account_name}.blob.core.windows.net"
-    return BlobServiceClient(account_url=account_url, credential=account_key)
+def download_ranges(blob_client, local_path: Path, size: int, etag: str = None) -> None:
+    """Download a blob as concurrent range requests written into a memory-mapped file.
 
+    The file is preallocated to its final size, so each range is written straight
+    into its own slice of the mapping without seeks or locks. Passing the etag makes
+    every range fail if the blob changes mid-download instead of mixing versions.
+    Ranges land in a temporary file beside local_path, which only replaces it once
+    every range has arrived, so a failed download leaves the previous copy intact.
+    """
+    from azure.core import MatchConditions
 
-def download_blob(blob_service: BlobServiceClient, container: str,
-                  blob_name: str, local_path: Path, overwrite: bool = True) -> bool:
-    """Download a single blob from Azure."""
+    conditions = {"etag": etag, "match_condition": MatchConditions.IfNotModified} if etag else {}
+
+    tmp_path = local_path.with_name(f".{local_path.name}.part")
+    try:
+        with open(tmp_path, "wb+") as f:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, size)
+            else:
+                f.truncate(size)
+
+            with mmap.mmap(f.fileno(), size) as mm:
+                def fetch(offset: int) -> None:
+                    length = min(RANGE_SIZE, size - offset)
+                    stream = blob_client.download_blob(offset=offset, length=length, **conditions)
+                    for chunk in stream.chunks():
+                        mm[offset:offset + len(chunk)] = chunk
+                        offset += len(chunk)
+
+                with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+                    # Consume the results so that a failed range raises here
+                    list(executor.map(fetch, range(0, size, RANGE_SIZE)))
+
+        os.replace(tmp_path, local_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def download_blob(container_client: ContainerClient, blob_name: str,
+                  local_path: Path, overwrite: bool = True, size: int = None,
+                  etag: str = None, md5: bytes = None, use_azcopy: bool = False) -> bool:
+    """Download a single blob from Azure.
+
+    Pass the blob size, etag and Content-MD5 when they are already known from a
+    listing to avoid an extra properties request. Blobs whose etag matches the one
+    recorded when the unchanged local copy was last synced are skipped. With
+    use_azcopy, the transfer is handed to azcopy when it is installed.
+    """
     if local_path.exists() and not overwrite:
-        print(f"  Skipped (exists): {local_path.name}")
+        log.info("  Skipped (exists): %s", local_path.name)
         return True
 
     local_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        container_client = blob_service.get_container_client(container)
         blob_client = container_client.get_blob_client(blob_name)
 
         # Get blob properties for size
-        properties = blob_client.get_blob_properties()
-        size = properties.size
-        size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
+        if size is None or etag is None:
+            properties = blob_client.get_blob_properties()
+            size, etag = properties.size, properties.etag
+            md5 = properties.content_settings.content_md5
+
+        if load_state(container_client.container_name, blob_name, local_path).get("etag") == etag:
+            log.info("  Unchanged: %s", blob_name)
+            return True
+
+        sas_url = blob_sas_url(blob_client, read=True) if use_azcopy and azcopy_available() else None
+        if not (sas_url and run_azcopy(sas_url, str(local_path))):
+            if size > RANGED_DOWNLOAD_THRESHOLD:
+                download_ranges(blob_client, local_path, size, etag)
+            else:
+                with open(local_path, "wb") as f:
+                    download_stream = blob_client.download_blob(max_concurrency=MAX_CONCURRENCY)
+                    download_stream.readinto(f)
 
-        print(f"  Downloading: {blob_name} ({size_str})")
-        print(f"    -> {local_path}")
+        if local_path.suffix == ".duckdb":
+            drop_page_cache(local_path)
 
-        with open(local_path, "wb") as f:
-            download_stream = blob_client.download_blob()
-            f.write(download_stream.readall())
+        # The local copy now matches the blob, so its Content-MD5 spares a later re-hash
+        save_state(container_client.container_name, blob_name, local_path, etag,
+                   bytes(md5) if md5 else None)
 
-        print(f"    Success")
+        log.info("  Downloaded: %s (%s) -> %s", blob_name, HumanSize(size), local_path)
         return True
 
     except Exception as e:
-        print(f"  Error downloading {blob_name}: {e}")
+        log.error("  Error downloading %s: %s", blob_name, e)
         return False
 
 
 def download_container(blob_service: BlobServiceClient, container: str,
-                       local_dir: Path, pattern: str = None) -> dict:
-    """Download all blobs from a container."""
-    results = {"success": 0, "failed": 0, "skipped": 0}
-
-    try:
-        container_client = blob_service.get_container_client(container)
-        blobs = list(container_client.list_blobs())
+                       local_dir: Path, pattern: str = None, prefix: str = None,
+                       workers: int = DEFAULT_WORKERS) -> dict:
+    """Download all blobs from a container, several at a time.
 
-        if not blobs:
-            print(f"  (container is empty)")
-            return results
-
-        for blob in blobs:
-            # Skip if pattern specified and doesn't match
-            if pattern and not blob.name.endswith(pattern):
-                continue
+    prefix is filtered by the service, so non-matching blobs are never listed;
+    pattern is a name suffix checked locally.
+    """
+    results = {"success": 0, "failed": 0, "skipped": 0}
+    container_client = get_container_client(blob_service, container)
+    listed = 0
 
-            local_path = local_dir / blob.name
+    # Transfers are network-bound, so run them concurrently over the shared client.
+    # Downloads are submitted page by page, so they start while listing continues.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
 
-            if download_blob(blob_service, container, blob.name, local_path):
+        try:
+            pages = container_client.list_blobs(
+                name_starts_with=prefix, results_per_page=LIST_PAGE_SIZE
+            ).by_page()
+
+            for page in pages:
+                for blob in page:
+                    listed += 1
+
+                    # Skip if pattern specified and doesn't match
+                    if pattern and not blob.name.endswith(pattern):
+                        continue
+
+                    futures.append(executor.submit(
+                        download_blob, container_client, blob.name,
+                        local_dir / blob.name, size=blob.size, etag=blob.etag,
+                        md5=blob.content_settings.content_md5
+                    ))
+
+        except Exception as e:
+            print(f"  Error listing container: {e}")
+            results["failed"] += 1
+
+        for future in as_completed(futures):
+            if future.result():
                 results["success"] += 1
             else:
                 results["failed"] += 1
 
-    except Exception as e:
-        print(f"  Error listing container: {e}")
-        results["failed"] += 1
+    if not listed and not results["failed"]:
+        print(f"  (container is empty)")
 
     return results
 
 
 def download_all(blob_service: BlobServiceClient, base_path: Path,
-                 include_raw: bool = True, include_db: bool = True) -> dict:
+                 include_raw: bool = True, include_db: bool = True,
+                 workers: int = DEFAULT_WORKERS, prefix: str = None) -> dict:
     """Download data from Azure to local filesystem."""
     total = {"success": 0, "failed": 0}
 
     if include_raw:
         print("\nDownloading raw data from 'raw' container...")
         raw_path = base_path / "data" / "raw"
-        results = download_container(blob_service, "raw", raw_path)
+        results = download_container(blob_service, "raw", raw_path, prefix=prefix, workers=workers)
         total["success"] += results["success"]
         total["failed"] += results["failed"]
 
     if include_db:
         print("\nDownloading DuckDB from 'duckdb' container...")
         db_path = base_path / "data" / "processed"
-        if download_blob(blob_service, "duckdb", "vibe.duckdb", db_path / "vibe.duckdb"):
+        container_client = get_container_client(blob_service, "duckdb")
+        if download_blob(container_client, "vibe.duckdb", db_path / "vibe.duckdb", use_azcopy=True):
             total["success"] += 1
         else:
             total["failed"] += 1
@@ -143,39 +342,77 @@ def download_all(blob_service: BlobServiceClient, base_path: Path,
     return total
 
 
-def upload_file(blob_service: BlobServiceClient, local_path: Path,
-                container: str, blob_name: str = None) -> bool:
-    """Upload a file to Azure."""
+def upload_file(container_client: ContainerClient, local_path: Path,
+                blob_name: str = None, remote: BlobProperties = None,
+                use_azcopy: bool = False) -> bool:
+    """Upload a file to Azure.
+
+    Pass the existing blob's listed properties as remote to skip the upload
+    when the blob already holds the same content. With use_azcopy, the transfer
+    is handed to azcopy when it is installed.
+    """
+    from azure.storage.blob import ContentSettings
+
     if not local_path.exists():
-        print(f"  Error: File not found: {local_path}")
+        log.error("  Error: File not found: %s", local_path)
         return False
 
     if blob_name is None:
         blob_name = local_path.name
 
     try:
-        container_client = blob_service.get_container_client(container)
         blob_client = container_client.get_blob_client(blob_name)
 
         size = local_path.stat().st_size
-        size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
 
-        print(f"  Uploading: {local_path.name} ({size_str})")
-        print(f"    -> {container}/{blob_name}")
+        # Unchanged since the last sync with this exact blob version: no need to hash
+        state = load_state(container_client.container_name, blob_name, local_path)
+        if remote is not None and state.get("etag") == remote.etag:
+            log.info("  Unchanged: %s", local_path.name)
+            return True
+
+        md5 = bytes.fromhex(state["md5"]) if state.get("md5") else file_md5(local_path)
 
-        with open(local_path, "rb") as data:
-            blob_client.upload_blob(data, overwrite=True)
+        remote_md5 = remote.content_settings.content_md5 if remote is not None else None
+        if remote_md5 and remote.size == size and bytes(remote_md5) == md5:
+            save_state(container_client.container_name, blob_name, local_path, remote.etag, md5)
+            log.info("  Unchanged: %s", local_path.name)
+            return True
 
-        print(f"    Success")
+        sas_url = blob_sas_url(blob_client, create=True, write=True) if use_azcopy and azcopy_available() else None
+        if sas_url and run_azcopy(str(local_path), sas_url, "--put-md5"):
+            etag = blob_client.get_blob_properties().etag
+        else:
+            with open(local_path, "rb") as f, (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if size > MMAP_THRESHOLD else contextlib.nullcontext(f)
+            ) as data:
+                result = blob_client.upload_blob(
+                    data,
+                    overwrite=True,
+                    length=size,
+                    max_concurrency=MAX_CONCURRENCY,
+                    content_settings=ContentSettings(content_md5=md5),
+                )
+            etag = result["etag"]
+
+        if local_path.suffix == ".duckdb":
+            drop_page_cache(local_path)
+
+        save_state(container_client.container_name, blob_name, local_path, etag, md5)
+
+        log.info("  Uploaded: %s (%s) -> %s/%s",
+                 local_path.name, HumanSize(size), container_client.container_name, blob_name)
         return True
 
     except Exception as e:
-        print(f"  Error uploading {local_path.name}: {e}")
+        log.error("  Error uploading %s: %s", local_path.name, e)
         return False
 
 
 def upload_all(blob_service: BlobServiceClient, base_path: Path,
-               include_raw: bool = True, include_db: bool = True) -> dict:
+               include_raw: bool = True, include_db: bool = True,
+               workers: int = DEFAULT_WORKERS) -> dict:
     """Upload data from local filesystem to Azure."""
     total = {"success": 0, "failed": 0}
 
@@ -184,9 +421,19 @@ def upload_all(blob_service: BlobServiceClient, base_path: Path,
         raw_path = base_path / "data" / "raw"
 
         if raw_path.exists():
-            for pattern in ["*.csv", "*.parquet", "*.json"]:
-                for file_path in raw_path.glob(pattern):
-                    if upload_file(blob_service, file_path, "raw"):
+            files = list_raw_files(raw_path)
+
+            container_client = get_container_client(blob_service, "raw")
+            remote = list_remote(container_client)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(upload_file, container_client, f, remote=remote.get(f.name))
+                    for f in files
+                ]
+
+                for future in as_completed(futures):
+                    if future.result():
                         total["success"] += 1
                     else:
                         total["failed"] += 1
@@ -198,7 +445,9 @@ def upload_all(blob_service: BlobServiceClient, base_path: Path,
         db_path = base_path / "data" / "processed" / "vibe.duckdb"
 
         if db_path.exists():
-            if upload_file(blob_service, db_path, "duckdb"):
+            container_client = get_container_client(blob_service, "duckdb")
+            remote = list_remote(container_client, prefix="vibe.duckdb")
+            if upload_file(container_client, db_path, remote=remote.get("vibe.duckdb"), use_azcopy=True):
                 total["success"] += 1
             else:
                 total["failed"] += 1
@@ -208,26 +457,67 @@ def upload_all(blob_service: BlobServiceClient, base_path: Path,
     return total
 
 
-def show_status(blob_service: BlobServiceClient, base_path: Path) -> None:
-    """Compare local files with Azure blobs."""
+def prune_blobs(container_client: ContainerClient, blob_names: list) -> dict:
+    """Delete blobs in batches of up to BATCH_SIZE names per request."""
+    results = {"success": 0, "failed": 0}
+
+    for i in range(0, len(blob_names), BATCH_SIZE):
+        chunk = blob_names[i:i + BATCH_SIZE]
+        try:
+            responses = list(container_client.delete_blobs(*chunk, raise_on_any_failure=False))
+        except Exception as e:
+            log.error("  Error deleting batch of %d blobs: %s", len(chunk), e)
+            results["failed"] += len(chunk)
+            continue
+
+        failed = [r for r in responses if r.status_code not in (200, 202, 404)]
+        results["failed"] += len(failed)
+        results["success"] += len(chunk) - len(failed)
+        log.info("  Deleted %d/%d blobs", len(chunk) - len(failed), len(chunk))
+
+    return results
+
+
+def confirm_prune(blob_names: list, assume_yes: bool = False) -> bool:
+    """List the blobs a prune would delete and ask before deleting them."""
+    print(f"\n  Would delete {len(blob_names)} blobs from 'raw':")
+    for name in blob_names:
+        print(f"    {name}")
+
+    if assume_yes:
+        return True
+    if not sys.stdin.isatty():
+        print("  Not a terminal; re-run with --yes to delete")
+        return False
+    return input("  Delete these blobs? [y/N] ").strip().lower() in ("y", "yes")
+
+
+def show_status(blob_service: BlobServiceClient, base_path: Path, prune: bool = False,
+                assume_yes: bool = False) -> None:
+    """Compare local files with Azure blobs, optionally deleting Azure-only raw blobs.
+
+    Pruning asks for confirmation first unless assume_yes is set.
+    """
     print("\nSync Status: Local vs Azure")
     print("=" * 70)
 
-    # Check raw files
-    print("\n[raw container]")
     raw_path = base_path / "data" / "raw"
-    local_raw_files = set()
+    db_path = base_path / "data" / "processed" / "vibe.duckdb"
+    container_client = get_container_client(blob_service, "raw")
 
-    if raw_path.exists():
-        for pattern in ["*.csv", "*.parquet", "*.json"]:
-            for f in raw_path.glob(pattern):
-                local_raw_files.add(f.name)
+    # The local scan and both container listings are independent, so run them together.
+    # The duckdb listing already carries blob sizes, so no separate properties request is needed
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        local_future = executor.submit(list_raw_files, raw_path) if raw_path.exists() else None
+        raw_future = executor.submit(list_remote, container_client)
+        db_future = executor.submit(list_remote, get_container_client(blob_service, "duckdb"), "vibe.duckdb")
 
-    try:
-        container_client = blob_service.get_container_client("raw")
-        azure_raw_files = {blob.name for blob in container_client.list_blobs()}
-    except Exception:
-        azure_raw_files = set()
+        local_raw_files = {f.name for f in local_future.result()} if local_future else set()
+        azure_raw_files = set(raw_future.result())
+        azure_db = db_future.result().get("vibe.duckdb")
+
+    # Check raw files
+    print("\n[raw container]")
 
     only_local = local_raw_files - azure_raw_files
     only_azure = azure_raw_files - local_raw_files
@@ -237,26 +527,32 @@ def show_status(blob_service: BlobServiceClient, base_path: Path) -> None:
     print(f"  Local only:   {len(only_local)} files {list(only_local) if only_local else ''}")
     print(f"  Azure only:   {len(only_azure)} files {list(only_azure) if only_azure else ''}")
 
+    # Only blobs the local scan could ever see are candidates; nested names and other
+    # suffixes are downloaded but never listed locally, so they would always look stale
+    prunable = sorted(
+        name for name in only_azure if "/" not in name and name.endswith(RAW_SUFFIXES)
+    )
+
+    if prune and prunable:
+        if not raw_path.exists():
+            # Without a local raw directory every blob would look stale
+            print(f"  Skipping prune: {raw_path} does not exist")
+        elif confirm_prune(prunable, assume_yes):
+            results = prune_blobs(container_client, prunable)
+            print(f"  Pruned: {results['success']} deleted, {results['failed']} failed")
+        else:
+            print("  Prune cancelled, nothing deleted")
+
     # Check DuckDB
     print("\n[duckdb container]")
-    db_path = base_path / "data" / "processed" / "vibe.duckdb"
     local_db_exists = db_path.exists()
-
-    try:
-        container_client = blob_service.get_container_client("duckdb")
-        azure_db_exists = any(blob.name == "vibe.duckdb" for blob in container_client.list_blobs())
-    except Exception:
-        azure_db_exists = False
+    azure_db_exists = azure_db is not None
 
     if local_db_exists and azure_db_exists:
         # Compare sizes
         local_size = db_path.stat().st_size
-        try:
-            blob_client = blob_service.get_blob_client("duckdb", "vibe.duckdb")
-            azure_size = blob_client.get_blob_properties().size
-            status = "MATCH" if local_size == azure_size else f"DIFFER (local: {local_size}, azure: {azure_size})"
-        except Exception:
-            status = "local exists"
+        azure_size = azure_db.size
+        status = "MATCH" if local_size == azure_size else f"DIFFER (local: {local_size}, azure: {azure_size})"
         print(f"  vibe.duckdb: {status}")
     elif local_db_exists:
         print(f"  vibe.duckdb: LOCAL ONLY")
@@ -277,8 +573,20 @@ def main():
     parser.add_argument("--status", action="store_true", help="Compare local vs Azure")
     parser.add_argument("--raw", action="store_true", help="Only sync raw data files")
     parser.add_argument("--db", action="store_true", help="Only sync DuckDB database")
+    parser.add_argument("--prefix", help="Only download raw blobs whose names start with this prefix")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Parallel blob transfers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--prune-azure", action="store_true",
+                        help="With --status, delete raw blobs that no longer exist locally")
+    parser.add_argument("--yes", action="store_true",
+                        help="Delete without asking for confirmation (with --prune-azure)")
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     base_path = Path(__file__).parent.parent
 
     try:
@@ -288,21 +596,23 @@ def main():
         print(f"Error connecting to Azure: {e}")
         sys.exit(1)
 
+    warn_if_hns(blob_service)
+
     # Determine what to sync
     include_raw = args.raw or (not args.raw and not args.db)
     include_db = args.db or (not args.raw and not args.db)
 
     if args.status or (not args.download and not args.upload):
-        show_status(blob_service, base_path)
+        show_status(blob_service, base_path, prune=args.prune_azure, assume_yes=args.yes)
         return
 
     if args.download:
-        results = download_all(blob_service, base_path, include_raw, include_db)
+        results = download_all(blob_service, base_path, include_raw, include_db, args.workers, args.prefix)
         print(f"\n{'=' * 50}")
         print(f"Download Complete: {results['success']} succeeded, {results['failed']} failed")
 
     if args.upload:
-        results = upload_all(blob_service, base_path, include_raw, include_db)
+        results = upload_all(blob_service, base_path, include_raw, include_db, args.workers)
         print(f"\n{'=' * 50}")
         print(f"Upload Complete: {results['success']} succeeded, {results['failed']} failed")
 
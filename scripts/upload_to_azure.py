@@ -17,43 +17,50 @@ Environment Variables (or use .env file):
     AZURE_STORAGE_CONNECTION_STRING - Alternative: full connection string
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
+import logging
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from azure_common import (
+    MAX_CONCURRENCY,
+    MMAP_THRESHOLD,
+    azcopy_available,
+    blob_sas_url,
+    file_md5,
+    get_blob_service_client,
+    get_container_client,
+    humansize,
+    list_raw_files,
+    run_azcopy,
+)
+
+# The Azure SDK is slow to import, so it is loaded only once a client is needed
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient, ContainerClient
+
+# Only pay for python-dotenv when there is a .env file to load
+ENV_FILE = Path(__file__).parent.parent / ".env"
+if ENV_FILE.exists():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+    except ImportError:
+        pass  # dotenv is optional
 
-try:
-    from azure.storage.blob import BlobServiceClient, ContentSettings
-except ImportError:
-    print("Error: azure-storage-blob not installed.")
-    print("Install with: pip install azure-storage-blob")
-    sys.exit(1)
-
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
-
-
-def get_blob_service_client() -> BlobServiceClient:
-    """Create Azure Blob Service client from environment variables."""
-    connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
-
-    if connection_string:
-        return BlobServiceClient.from_connection_string(connection_string)
-
-    account_name = os.environ.get("AZURE_STORAGE_ACCOUNT")
-    account_key = os.environ.get("AZURE_STORAGE_KEY")
+# Per-file progress goes through a logger rather than print; main() sends it to stdout
+log = logging.getLogger("upload_to_azure")
 
-    if not account_name or not account_key:
-        print("Error: Azure credentials not configured.")
-        print("Set AZURE_STORAGE_CONNECTION_STRING or both AZURE_STORAGE_ACCOUNT and AZURE_STORAGE_KEY")
-        sys.exit(1)
-
-    account_url = f"https://{account_name}.blob.core.windows.net"
-    return BlobServiceClient(account_url=account_url, credential=account_key)
+# Default number of files uploaded in parallel
+DEFAULT_WORKERS = 16
 
 
 def get_content_type(file_path: Path) -> str:
@@ -68,45 +75,55 @@ def get_content_type(file_path: Path) -> str:
     return content_types.get(file_path.suffix.lower(), "application/octet-stream")
 
 
-def upload_file(blob_service: BlobServiceClient, local_path: Path,
-                container: str, blob_name: str = None, overwrite: bool = True) -> bool:
+def upload_file(container_client: ContainerClient, local_path: Path,
+                blob_name: str = None, overwrite: bool = True) -> bool:
     """Upload a single file to Azure Blob Storage."""
+    from azure.storage.blob import ContentSettings
+
     if not local_path.exists():
-        print(f"  Error: File not found: {local_path}")
+        log.error("  Error: File not found: %s", local_path)
         return False
 
     if blob_name is None:
         blob_name = local_path.name
 
-    container_client = blob_service.get_container_client(container)
     blob_client = container_client.get_blob_client(blob_name)
 
     file_size = local_path.stat().st_size
-    size_str = f"{file_size:,} bytes" if file_size < 1024 else f"{file_size/1024:.1f} KB"
-
-    print(f"  Uploading: {local_path.name} ({size_str})")
-    print(f"    -> {container}/{blob_name}")
 
     try:
-        content_settings = ContentSettings(content_type=get_content_type(local_path))
-
-        with open(local_path, "rb") as data:
+        # Blobs uploaded as block lists get no service-computed Content-MD5, and
+        # sync_azure relies on it to skip unchanged files
+        content_settings = ContentSettings(
+            content_type=get_content_type(local_path),
+            content_md5=file_md5(local_path),
+        )
+
+        with open(local_path, "rb") as f, (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if file_size > MMAP_THRESHOLD else contextlib.nullcontext(f)
+        ) as data:
             blob_client.upload_blob(
                 data,
                 overwrite=overwrite,
-                content_settings=content_settings
+                length=file_size,
+                content_settings=content_settings,
+                max_concurrency=MAX_CONCURRENCY,
             )
 
-        print(f"    Success")
+        # One record per file once it's done, so concurrent uploads don't interleave
+        log.info("  Uploaded: %s (%s) -> %s/%s",
+                 local_path.name, humansize(file_size), container_client.container_name, blob_name)
         return True
 
     except Exception as e:
-        print(f"    Error: {e}")
+        log.error("  Error uploading %s: %s", local_path.name, e)
         return False
 
 
-def upload_raw_files(blob_service: BlobServiceClient, base_path: Path) -> dict:
-    """Upload all raw data files to the 'raw' container."""
+def upload_raw_files(blob_service: BlobServiceClient, base_path: Path,
+                     workers: int = DEFAULT_WORKERS) -> dict:
+    """Upload all raw data files to the 'raw' container, several at a time."""
     results = {"success": 0, "failed": 0}
     raw_path = base_path / "data" / "raw"
 
@@ -117,11 +134,16 @@ def upload_raw_files(blob_service: BlobServiceClient, base_path: Path) -> dict:
         return results
 
     # Upload CSV, Parquet, and JSON files
-    patterns = ["*.csv", "*.parquet", "*.json"]
+    files = list_raw_files(raw_path)
+
+    container_client = get_container_client(blob_service, "raw")
 
-    for pattern in patterns:
-        for file_path in raw_path.glob(pattern):
-            if upload_file(blob_service, file_path, "raw"):
+    # Uploads are network-bound, so run them concurrently over the shared client
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(upload_file, container_client, f) for f in files]
+
+        for future in as_completed(futures):
+            if future.result():
                 results["success"] += 1
             else:
                 results["failed"] += 1
@@ -139,7 +161,18 @@ def upload_duckdb(blob_service: BlobServiceClient, base_path: Path) -> bool:
         print(f"  Warning: Database not found: {db_path}")
         return False
 
-    return upload_file(blob_service, db_path, "duckdb", "vibe.duckdb")
+    container_client = get_container_client(blob_service, "duckdb")
+
+    # azcopy moves large files faster than the SDK; use it when installed
+    if azcopy_available():
+        sas_url = blob_sas_url(container_client.get_blob_client("vibe.duckdb"), create=True, write=True)
+        if sas_url:
+            if run_azcopy(str(db_path), sas_url, "--put-md5", f"--content-type={get_content_type(db_path)}"):
+                log.info("  Uploaded: %s (%s) -> duckdb/vibe.duckdb with azcopy",
+                         db_path.name, humansize(db_path.stat().st_size))
+                return True
+
+    return upload_file(container_client, db_path, "vibe.duckdb")
 
 
 def upload_logs(blob_service: BlobServiceClient, base_path: Path) -> dict:
@@ -153,12 +186,14 @@ def upload_logs(blob_service: BlobServiceClient, base_path: Path) -> dict:
         print(f"  Warning: Logs directory not found: {logs_path}")
         return results
 
+    container_client = get_container_client(blob_service, "logs")
+
     for file_path in logs_path.glob("*.log"):
         # Add timestamp to log file name to preserve history
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         blob_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
 
-        if upload_file(blob_service, file_path, "logs", blob_name):
+        if upload_file(container_client, file_path, blob_name):
             results["success"] += 1
         else:
             results["failed"] += 1
@@ -175,7 +210,7 @@ def list_blobs(blob_service: BlobServiceClient, container: str = None) -> None:
 
     for container_name in containers:
         try:
-            container_client = blob_service.get_container_client(container_name)
+            container_client = get_container_client(blob_service, container_name)
             blobs = list(container_client.list_blobs())
 
             print(f"\n{container_name}/ ({len(blobs)} files)")
@@ -184,9 +219,8 @@ def list_blobs(blob_service: BlobServiceClient, container: str = None) -> None:
             if blobs:
                 for blob in blobs:
                     size = blob.size
-                    size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
                     modified = blob.last_modified.strftime("%Y-%m-%d %H:%M") if blob.last_modified else "N/A"
-                    print(f"  {blob.name:<30} {size_str:>12}  {modified}")
+                    print(f"  {blob.name:<30} {humansize(size):>12}  {modified}")
             else:
                 print("  (empty)")
 
@@ -204,8 +238,15 @@ def main():
     parser.add_argument("--file", help="Upload specific file to raw container")
     parser.add_argument("--list", action="store_true", help="List files in Azure")
     parser.add_argument("--container", help="Container for --list (default: all)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Parallel file uploads (default: {DEFAULT_WORKERS})")
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     base_path = Path(__file__).parent.parent
 
     try:
@@ -225,7 +266,7 @@ def main():
         if not file_path.exists():
             file_path = Path(args.file)
         print(f"\nUploading single file...")
-        upload_file(blob_service, file_path, "raw")
+        upload_file(get_container_client(blob_service, "raw"), file_path)
         return
 
     # Track overall results
@@ -233,7 +274,7 @@ def main():
     total_failed = 0
 
     if args.all or args.raw or (not args.db and not args.logs):
-        results = upload_raw_files(blob_service, base_path)
+        results = upload_raw_files(blob_service, base_path, args.workers)
         total_success += results["success"]
         total_failed += results["failed"]
 